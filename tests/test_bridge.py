@@ -0,0 +1,133 @@
+"""
+Tests for the TCP/RFC 2217 session bridge, run against a pyserial loop:// port
+"""
+
+import socket
+import threading
+import time
+
+import pytest
+
+pytest.importorskip('flask')
+pytest.importorskip('flask_socketio')
+serial = pytest.importorskip('serial')
+
+from uart_manager import ConnectionStatus, SerialBridge, SerialSession, SessionConfig, BridgeClient
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def recv_exactly(sock, length, timeout=5.0):
+    sock.settimeout(timeout)
+    data = b''
+    while len(data) < length:
+        chunk = sock.recv(length - len(data))
+        if not chunk:
+            break
+        data += chunk
+    return data
+
+
+@pytest.fixture
+def session():
+    """A connected session whose writes loop back into its own read loop"""
+    session = SerialSession(SessionConfig(session_id=1, port='loop://'))
+    session.connection = serial.serial_for_url('loop://', baudrate=115200, timeout=1)
+    session.status = ConnectionStatus.CONNECTED
+    session.running = True
+    session.read_thread = threading.Thread(target=session._read_loop, daemon=True)
+    session.read_thread.start()
+    
+    yield session
+    
+    session.disconnect()
+
+
+def connect_client(session):
+    count = len(session.bridge.clients)
+    client = socket.create_connection(('127.0.0.1', session.bridge.port))
+    assert wait_for(lambda: len(session.bridge.clients) == count + 1)
+    return client
+
+
+def test_fan_out_to_raw_clients(session):
+    assert session.start_bridge(0)
+    first = connect_client(session)
+    second = connect_client(session)
+    
+    session.connection.write(b'\x01\x02\x03')
+    
+    assert recv_exactly(first, 3) == b'\x01\x02\x03'
+    assert recv_exactly(second, 3) == b'\x01\x02\x03'
+    
+    first.close()
+    second.close()
+
+
+def test_slow_client_drops_oldest_data(session):
+    bridge = SerialBridge(session, '127.0.0.1', 0, max_queue_bytes=10)
+    left, right = socket.socketpair()
+    
+    # Not started, so nothing drains the queue
+    client = BridgeClient(bridge, left, ('test', 0))
+    for chunk in (b'aaaa', b'bbbb', b'cccc', b'dddd', b'eeee'):
+        client.write(chunk)
+    
+    assert list(client.queue) == [b'dddd', b'eeee']
+    assert client.queued_bytes == 8
+    assert client.bytes_dropped == 12
+    
+    # A chunk larger than the limit replaces everything queued before it
+    client.write(b'x' * 32)
+    assert list(client.queue) == [b'x' * 32]
+    assert client.bytes_dropped == 20
+    
+    left.close()
+    right.close()
+
+
+def test_client_writes_are_logged_as_sent(session):
+    assert session.start_bridge(0)
+    client = connect_client(session)
+    
+    client.sendall(b'ping\n')
+    
+    # loop:// echoes the write back, so it shows up as sent and then received
+    assert wait_for(lambda: len(session.get_recent_messages(0)) == 2)
+    messages = [(msg['message'], msg['message_type']) for msg in session.get_recent_messages(0)]
+    assert messages == [('ping', 'sent'), ('ping', 'received')]
+    assert session.stats['bytes_sent'] == 5
+    assert recv_exactly(client, 5) == b'ping\n'
+    
+    client.close()
+
+
+def test_rfc2217_client_cannot_change_baud_rate(session):
+    assert session.start_bridge(0, mode='rfc2217')
+    url = f'rfc2217://127.0.0.1:{session.bridge.port}'
+    
+    client = serial.serial_for_url(url, baudrate=115200, timeout=1)
+    try:
+        with pytest.raises(ValueError, match='remote rejected value'):
+            client.baudrate = 9600
+    finally:
+        client.close()
+    
+    assert session.connection.baudrate == 115200
+
+
+def test_failed_restart_keeps_running_bridge(session):
+    assert session.start_bridge(0)
+    bridge = session.bridge
+    
+    # The port is taken by the running bridge itself
+    assert not session.start_bridge(bridge.port)
+    assert session.bridge is bridge
+    assert bridge.running
@@ -0,0 +1,103 @@
+"""
+Tests for the capture file format used by recording and replay
+"""
+
+import pytest
+
+pytest.importorskip('flask')
+pytest.importorskip('flask_socketio')
+
+from uart_manager import CaptureRecorder, ReplaySession, SerialSession, SessionConfig, read_capture, CAPTURE_RECORD
+
+
+CHUNKS = [b'boot\r\n', b'\x00\x01\xff', b'>']
+
+
+def write_capture(path):
+    recorder = CaptureRecorder(str(path), {'session_id': 1, 'port': 'loop://', 'baud_rate': 115200})
+    base_ns = recorder.last_monotonic_ns
+    for index, chunk in enumerate(CHUNKS, start=1):
+        recorder.record(chunk, base_ns + index * 1000000)
+    recorder.close()
+    return recorder
+
+
+def test_capture_round_trip(tmp_path):
+    path = tmp_path / 'session.uartcap'
+    recorder = write_capture(path)
+    
+    assert recorder.chunks_recorded == len(CHUNKS)
+    assert recorder.bytes_recorded == sum(len(chunk) for chunk in CHUNKS)
+    
+    header, records = read_capture(str(path))
+    assert header['session_id'] == 1
+    assert header['port'] == 'loop://'
+    assert header['baud_rate'] == 115200
+    assert 'start_time' in header
+    
+    assert list(records) == [(1000000, chunk) for chunk in CHUNKS]
+
+
+def test_capture_truncated_tail(tmp_path):
+    path = tmp_path / 'session.uartcap'
+    write_capture(path)
+    
+    # Cut the last record in half, as an interrupted recording would
+    data = path.read_bytes()
+    cut = (CAPTURE_RECORD.size + len(CHUNKS[-1])) // 2
+    path.write_bytes(data[:-cut])
+    
+    header, records = read_capture(str(path))
+    assert [chunk for _, chunk in records] == CHUNKS[:-1]
+
+
+def test_capture_rejects_other_files(tmp_path):
+    path = tmp_path / 'not_a_capture.bin'
+    path.write_bytes(b'hello world')
+    
+    with pytest.raises(ValueError):
+        read_capture(str(path))
+
+
+def test_recording_never_overwrites_existing_capture(tmp_path):
+    path = tmp_path / 'session.uartcap'
+    write_capture(path)
+    original = path.read_bytes()
+    
+    session = SerialSession(SessionConfig(session_id=1, port='loop://'))
+    assert session.start_recording(str(tmp_path / 'current.uartcap'))
+    current = session.recorder
+    
+    with pytest.raises(FileExistsError):
+        session.start_recording(str(path))
+    
+    # The existing file is untouched and the running recording carries on
+    assert path.read_bytes() == original
+    assert session.recorder is current
+    session.stop_recording()
+
+
+def replay_messages(path, chunks):
+    recorder = CaptureRecorder(str(path), {'session_id': 1, 'port': 'loop://', 'baud_rate': 115200})
+    monotonic_ns = recorder.last_monotonic_ns
+    for delta_ns, chunk in chunks:
+        monotonic_ns += delta_ns
+        recorder.record(chunk, monotonic_ns)
+    recorder.close()
+    
+    session = ReplaySession(SessionConfig(session_id=1, port='replay'), str(path), speed=0)
+    assert session.connect()
+    session.read_thread.join(timeout=5)
+    assert not session.line_buffer
+    return [msg['message'] for msg in session.get_recent_messages(0)]
+
+
+def test_replay_flushes_trailing_partial_line(tmp_path):
+    messages = replay_messages(tmp_path / 'prompt.uartcap', [(1000, b'hello\nwor'), (1000, b'ld\r\n> ')])
+    assert messages == ['hello', 'world', '>']
+
+
+def test_replay_flushes_partial_line_after_recorded_idle_gap(tmp_path):
+    # The prompt was followed by two seconds of silence, longer than the 1 s read timeout
+    messages = replay_messages(tmp_path / 'idle.uartcap', [(1000, b'> '), (2000000000, b'ok\n')])
+    assert messages == ['>', 'ok']
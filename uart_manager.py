@@ -7,10 +7,16 @@ from flask import Flask, request, jsonify, render_template
 
 from flask_socketio import SocketIO, emit
 import asyncio
+import os
 import json
+import math
 import time
+import heapq
+import socket
+import struct
 import threading
-from typing import Dict, List, Optional, Any
+from collections import deque
+from typing import Dict, List, Optional, Any, Iterable, Iterator, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
 import logging
@@ -18,6 +24,7 @@ import logging
 try:
     import serial
     import serial.tools.list_ports
+    import serial.rfc2217
     SERIAL_AVAILABLE = True
 except ImportError:
     SERIAL_AVAILABLE = False
@@ -41,6 +48,104 @@ except ValueError:
         socketio = SocketIO(app, cors_allowed_origins="*")
 
 
+# Capture clock: every event is stamped once from a high-resolution monotonic
+# counter, and that counter is mapped onto wall time a single time at startup.
+# Wall-clock jumps (NTP, DST, manual changes) therefore cannot reorder events.
+_CLOCK_MONOTONIC_ORIGIN_NS = time.perf_counter_ns()
+_CLOCK_WALL_ORIGIN = time.time()
+
+
+def capture_timestamp() -> Tuple[int, float]:
+    """Return (monotonic_ns, wall_time) for an event captured right now"""
+    monotonic_ns = time.perf_counter_ns()
+    wall_time = _CLOCK_WALL_ORIGIN + (monotonic_ns - _CLOCK_MONOTONIC_ORIGIN_NS) / 1e9
+    return monotonic_ns, wall_time
+
+
+# Capture file format: MAGIC, a length-prefixed JSON header, then one record
+# per received chunk: <delta_ns since previous chunk, length> followed by data.
+CAPTURE_MAGIC = b'UARTCAP\x01'
+CAPTURE_HEADER = struct.Struct('<I')
+CAPTURE_RECORD = struct.Struct('<QI')
+CAPTURE_DIR = 'captures'
+
+
+class CaptureRecorder:
+    """Records raw received bytes with inter-arrival timing to a capture file"""
+    
+    def __init__(self, path: str, metadata: Dict[str, Any]):
+        self.path = path
+        self.lock = threading.Lock()
+        self.chunks_recorded = 0
+        self.bytes_recorded = 0
+        
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        header = json.dumps(dict(metadata, start_time=time.time())).encode('utf-8')
+        self.file = open(path, 'xb')  # Never overwrite an existing capture
+        try:
+            self.file.write(CAPTURE_MAGIC)
+            self.file.write(CAPTURE_HEADER.pack(len(header)))
+            self.file.write(header)
+        except Exception:
+            self.file.close()
+            raise
+        self.last_monotonic_ns = time.perf_counter_ns()
+    
+    def record(self, data: bytes, monotonic_ns: int):
+        """Append one received chunk"""
+        with self.lock:
+            if self.file is None:
+                return
+            delta_ns = max(0, monotonic_ns - self.last_monotonic_ns)
+            self.last_monotonic_ns = max(self.last_monotonic_ns, monotonic_ns)
+            self.file.write(CAPTURE_RECORD.pack(delta_ns, len(data)))
+            self.file.write(data)
+            self.chunks_recorded += 1
+            self.bytes_recorded += len(data)
+    
+    def close(self):
+        """Flush and close the capture file"""
+        with self.lock:
+            if self.file is not None:
+                self.file.close()
+                self.file = None
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'path': self.path,
+            'chunks_recorded': self.chunks_recorded,
+            'bytes_recorded': self.bytes_recorded
+        }
+
+
+def read_capture(path: str) -> Tuple[Dict[str, Any], Iterator[Tuple[int, bytes]]]:
+    """Open a capture file, returning its header and a (delta_ns, data) iterator"""
+    f = open(path, 'rb')
+    try:
+        if f.read(len(CAPTURE_MAGIC)) != CAPTURE_MAGIC:
+            raise ValueError(f"Not a capture file: {path}")
+        (header_length,) = CAPTURE_HEADER.unpack(f.read(CAPTURE_HEADER.size))
+        header = json.loads(f.read(header_length).decode('utf-8'))
+    except Exception:
+        f.close()
+        raise
+    
+    def records():
+        with f:
+            while True:
+                raw = f.read(CAPTURE_RECORD.size)
+                if len(raw) < CAPTURE_RECORD.size:
+                    break  # End of file, or truncated by an interrupted recording
+                delta_ns, length = CAPTURE_RECORD.unpack(raw)
+                data = f.read(length)
+                if len(data) < length:
+                    break
+                yield delta_ns, data
+    
+    return header, records()
 
 
 class ConnectionStatus(Enum):
@@ -56,6 +161,7 @@ class SerialMessage:
     session_id: int
     message: str
     message_type: str = "received"  # sent, received, error, info
+    monotonic_ns: int = 0  # capture clock reading, used for ordering
 
 
 @dataclass
@@ -80,6 +186,15 @@ class SerialSession:
         self.read_thread: Optional[threading.Thread] = None
         self.running = False
         self.message_buffer: List[SerialMessage] = []
+        self.buffer_lock = threading.Lock()
+        self.max_buffer_size = 1000
+        self.recorder: Optional[CaptureRecorder] = None
+        self.line_buffer = bytearray()  # Received bytes not yet terminated by a newline
+        self.line_buffer_captured: Optional[Tuple[int, float]] = None
+        self.last_receive_ns = 0
+        self.max_line_length = 4096
+        self.bridge: Optional['SerialBridge'] = None
+        self.write_lock = threading.Lock()  # Arbitrates API sends and bridge client writes
         self.stats = {
             'bytes_sent': 0,
             'bytes_received': 0,
@@ -187,6 +302,9 @@ class SerialSession:
             
             if self.connection and self.connection.is_open:
                 self.connection.close()
+            
+            self.stop_recording()
+            self.stop_bridge()
                 
             self.status = ConnectionStatus.DISCONNECTED
             logger.info(f"Session {self.config.session_id} disconnected")
@@ -224,27 +342,30 @@ class SerialSession:
                 message += '\n'
             
             bytes_to_send = message.encode('utf-8')
-            bytes_sent = self.connection.write(bytes_to_send)
+            with self.write_lock:
+                bytes_sent = self.connection.write(bytes_to_send)
+            monotonic_ns, timestamp = capture_timestamp()
             
             if bytes_sent > 0:
                 self.stats['bytes_sent'] += bytes_sent
                 self.stats['messages_sent'] += 1
-                self.stats['last_activity'] = time.time()
+                self.stats['last_activity'] = timestamp
                 
                 # Log sent message
                 sent_msg = SerialMessage(
-                    timestamp=time.time(),
+                    timestamp=timestamp,
                     session_id=self.config.session_id,
                     message=message.strip(),
-                    message_type="sent"
+                    message_type="sent",
+                    monotonic_ns=monotonic_ns
                 )
-                self.message_buffer.append(sent_msg)
+                self._append_message(sent_msg)
                 
                 # Emit sent message to frontend
                 socketio.emit('message_sent', {
                     'session_id': self.config.session_id,
                     'message': message.strip(),
-                    'timestamp': time.time()
+                    'timestamp': timestamp
                 })
                 
                 logger.info(f"Session {self.config.session_id} sent: {message.strip()}")
@@ -265,14 +386,15 @@ class SerialSession:
     def _mock_send(self, message: str) -> bool:
         """Mock send for testing"""
         logger.info(f"Mock send on session {self.config.session_id}: {message}")
+        _, timestamp = capture_timestamp()
         self.stats['messages_sent'] += 1
-        self.stats['last_activity'] = time.time()
+        self.stats['last_activity'] = timestamp
         
         # Emit sent message to frontend
         socketio.emit('message_sent', {
             'session_id': self.config.session_id,
             'message': message.strip(),
-            'timestamp': time.time()
+            'timestamp': timestamp
         })
         
         return True
@@ -283,13 +405,14 @@ class SerialSession:
         
         while self.running and self.connection and self.connection.is_open:
             try:
-                if self.connection.in_waiting > 0:
-                    data = self.connection.readline()
+                waiting = self.connection.in_waiting
+                if waiting > 0:
+                    # Read whatever has arrived so every chunk is stamped on arrival
+                    data = self.connection.read(waiting)
                     if data:
-                        message = data.decode('utf-8', errors='ignore').strip()
-                        if message:
-                            self._process_received_message(message)
+                        self._ingest_data(data, capture_timestamp())
                 else:
+                    self._flush_stale_line()
                     time.sleep(0.01)  # Small delay to prevent CPU hogging
                     
             except Exception as e:
@@ -334,43 +457,222 @@ class SerialSession:
                 if self.running:
                     message = mock_messages[message_index % len(mock_messages)]
                     message_index += 1
-                    self._process_received_message(message)
+                    self._ingest_data((message + '\n').encode('utf-8'), capture_timestamp())
                     
             except Exception as e:
                 logger.error(f"Mock read error: {str(e)}")
                 break
     
-    def _process_received_message(self, message: str):
+    def _ingest_data(self, data: bytes, captured: Tuple[int, float]):
+        """Entry point for raw received bytes, shared by all read sources"""
+        recorder = self.recorder
+        if recorder is not None:
+            try:
+                recorder.record(data, captured[0])
+            except Exception as e:
+                logger.error(f"Capture record error for session {self.config.session_id}: {str(e)}")
+                self.stop_recording()
+        
+        bridge = self.bridge
+        if bridge is not None:
+            bridge.publish(data)
+        
+        # Split into lines only after the recorder and bridge have seen the raw chunk
+        buffer = self.line_buffer
+        if not buffer:
+            self.line_buffer_captured = captured
+        buffer += data
+        self.last_receive_ns = captured[0]
+        
+        # Lines are stamped with the arrival of their first byte
+        start = 0
+        newline = buffer.find(b'\n')
+        while newline >= 0:
+            self._process_received_line(buffer[start:newline], self.line_buffer_captured if start == 0 else captured)
+            start = newline + 1
+            newline = buffer.find(b'\n', start)
+        
+        if start:
+            del buffer[:start]
+            self.line_buffer_captured = captured
+        
+        if len(buffer) > self.max_line_length:
+            self._flush_line_buffer()
+    
+    def _process_received_line(self, line: bytes, captured: Tuple[int, float]):
+        message = line.decode('utf-8', errors='ignore').strip()
+        if message:
+            self._process_received_message(message, captured)
+    
+    def _flush_line_buffer(self):
+        """Emit an unterminated line, stamped when its first byte arrived"""
+        if self.line_buffer:
+            self._process_received_line(bytes(self.line_buffer), self.line_buffer_captured)
+            self.line_buffer.clear()
+    
+    def _flush_stale_line(self):
+        """Emit a partial line (e.g. a prompt) once the port has been idle for the read timeout"""
+        if self.line_buffer:
+            idle_ns = time.perf_counter_ns() - self.last_receive_ns
+            if idle_ns >= self.config.timeout * 1e9:
+                self._flush_line_buffer()
+    
+    def write_raw(self, data: bytes) -> int:
+        """Write raw bytes to the port on behalf of a bridge client"""
+        if self.status != ConnectionStatus.CONNECTED:
+            raise Exception("Session not connected")
+        
+        with self.write_lock:
+            if SERIAL_AVAILABLE and self.connection:
+                bytes_sent = self.connection.write(data) or 0
+            else:
+                bytes_sent = len(data)
+        monotonic_ns, timestamp = capture_timestamp()
+        
+        self.stats['bytes_sent'] += bytes_sent
+        self.stats['last_activity'] = timestamp
+        
+        # Log bridge writes like API sends so they reach the UI, exports and the timeline
+        message = data.decode('utf-8', errors='ignore').strip()
+        if bytes_sent > 0 and message:
+            self.stats['messages_sent'] += 1
+            self._append_message(SerialMessage(
+                timestamp=timestamp,
+                session_id=self.config.session_id,
+                message=message,
+                message_type="sent",
+                monotonic_ns=monotonic_ns
+            ))
+            
+            socketio.emit('message_sent', {
+                'session_id': self.config.session_id,
+                'message': message,
+                'timestamp': timestamp
+            })
+        
+        return bytes_sent
+    
+    def start_bridge(self, port: int, host: str = '127.0.0.1', mode: str = 'raw',
+                     max_queue_bytes: int = 1024 * 1024) -> bool:
+        """Expose the session's byte stream on a TCP port"""
+        try:
+            # Start the new bridge first so a failed restart leaves the running one intact
+            bridge = SerialBridge(self, host, port, mode, max_queue_bytes)
+            bridge.start()
+            
+            previous = self.bridge
+            self.bridge = bridge
+            if previous is not None:
+                previous.stop()
+            return True
+        except Exception as e:
+            logger.error(f"Start bridge error for session {self.config.session_id}: {str(e)}")
+            self.stats['errors'].append({
+                'timestamp': time.time(),
+                'error': str(e),
+                'type': 'bridge'
+            })
+            return False
+    
+    def stop_bridge(self) -> Optional[Dict[str, Any]]:
+        """Close the TCP bridge and all of its clients"""
+        bridge = self.bridge
+        if bridge is None:
+            return None
+        
+        self.bridge = None
+        bridge.stop()
+        return bridge.get_stats()
+    
+    def start_recording(self, path: str) -> bool:
+        """Start saving received raw bytes to a capture file
+        
+        Raises FileExistsError if the capture file already exists.
+        """
+        try:
+            # Open the new file first so a failed start keeps the current recording
+            recorder = CaptureRecorder(path, {
+                'session_id': self.config.session_id,
+                'port': self.config.port,
+                'baud_rate': self.config.baud_rate
+            })
+            self.stop_recording()
+            self.recorder = recorder
+            logger.info(f"Session {self.config.session_id} recording to {path}")
+            return True
+        except FileExistsError:
+            raise
+        except Exception as e:
+            logger.error(f"Start recording error for session {self.config.session_id}: {str(e)}")
+            self.stats['errors'].append({
+                'timestamp': time.time(),
+                'error': str(e),
+                'type': 'recording'
+            })
+            return False
+    
+    def stop_recording(self) -> Optional[Dict[str, Any]]:
+        """Stop recording and return the recorder statistics"""
+        recorder = self.recorder
+        if recorder is None:
+            return None
+        
+        self.recorder = None
+        recorder.close()
+        logger.info(f"Session {self.config.session_id} stopped recording to {recorder.path}")
+        return recorder.get_stats()
+    
+    def _process_received_message(self, message: str, captured: Optional[Tuple[int, float]] = None):
         """Process and forward received message"""
         try:
+            monotonic_ns, timestamp = captured or capture_timestamp()
+            
             self.stats['messages_received'] += 1
             self.stats['bytes_received'] += len(message.encode('utf-8'))
-            self.stats['last_activity'] = time.time()
+            self.stats['last_activity'] = timestamp
             
             # Create message object
             msg = SerialMessage(
-                timestamp=time.time(),
+                timestamp=timestamp,
                 session_id=self.config.session_id,
                 message=message,
-                message_type="received"
+                message_type="received",
+                monotonic_ns=monotonic_ns
             )
             
-            self.message_buffer.append(msg)
-            
-            # Limit buffer size
-            if len(self.message_buffer) > 1000:
-                self.message_buffer = self.message_buffer[-1000:]
+            self._append_message(msg)
             
             # Emit received message to frontend
             socketio.emit('message_received', {
                 'session_id': self.config.session_id,
                 'message': message,
-                'timestamp': time.time()
+                'timestamp': timestamp
             })
             
         except Exception as e:
             logger.error(f"Message processing error: {str(e)}")
     
+    def _append_message(self, msg: SerialMessage):
+        """Insert message into the buffer, keeping it ordered by capture time"""
+        with self.buffer_lock:
+            buffer = self.message_buffer
+            
+            # Sends and reads are stamped on different threads, so a message can
+            # arrive slightly behind the tail; walk back only as far as needed
+            index = len(buffer)
+            while index > 0 and buffer[index - 1].monotonic_ns > msg.monotonic_ns:
+                index -= 1
+            buffer.insert(index, msg)
+            
+            # Limit buffer size
+            if len(buffer) > self.max_buffer_size:
+                del buffer[:len(buffer) - self.max_buffer_size]
+    
+    def snapshot_messages(self) -> List[SerialMessage]:
+        """Return a consistent copy of the buffer, ordered by capture time"""
+        with self.buffer_lock:
+            return list(self.message_buffer)
+    
     def get_stats(self) -> Dict[str, Any]:
         """Get session statistics"""
         stats = self.stats.copy()
@@ -379,6 +681,12 @@ class SerialSession:
         stats['baud_rate'] = self.config.baud_rate
         stats['message_count'] = len(self.message_buffer)
         
+        recorder = self.recorder
+        stats['recording'] = recorder.get_stats() if recorder else None
+        
+        bridge = self.bridge
+        stats['bridge'] = bridge.get_stats() if bridge else None
+        
         if stats['connection_time']:
             stats['uptime'] = time.time() - stats['connection_time']
         
@@ -386,15 +694,454 @@ class SerialSession:
 
     def get_recent_messages(self, count: int = 50) -> List[Dict[str, Any]]:
         """Get recent messages for export/display"""
-        recent_messages = self.message_buffer[-count:] if count > 0 else self.message_buffer
+        messages = self.snapshot_messages()
+        recent_messages = messages[-count:] if count > 0 else messages
         return [asdict(msg) for msg in recent_messages]
 
     def clear_message_buffer(self):
         """Clear the message buffer"""
-        self.message_buffer.clear()
+        with self.buffer_lock:
+            self.message_buffer.clear()
         logger.info(f"Message buffer cleared for session {self.config.session_id}")
 
 
+class ReplaySession(SerialSession):
+    """Virtual session that plays a capture file through the normal ingest pipeline"""
+    
+    def __init__(self, config: SessionConfig, capture_path: str, speed: float = 1.0):
+        super().__init__(config)
+        self.capture_path = capture_path
+        self.speed = speed  # 1.0 = real time, N = N times faster, 0 = maximum speed
+        self.stats['replay'] = {
+            'path': capture_path,
+            'speed': speed,
+            'chunks_replayed': 0,
+            'bytes_replayed': 0,
+            'started': None,
+            'finished': None,
+            'duration': None,
+            'throughput_bps': None
+        }
+    
+    def connect(self) -> bool:
+        """Open the capture file and start replaying it"""
+        try:
+            self.status = ConnectionStatus.CONNECTING
+            header, records = read_capture(self.capture_path)
+            logger.info(f"Replaying {self.capture_path} (recorded from {header.get('port')}) "
+                        f"into session {self.config.session_id}")
+            
+            self.status = ConnectionStatus.CONNECTED
+            self.stats['connection_time'] = time.time()
+            self.running = True
+            
+            self.read_thread = threading.Thread(target=self._replay_loop, args=(records,), daemon=True)
+            self.read_thread.start()
+            
+            socketio.emit('session_status', {
+                'session_id': self.config.session_id,
+                'status': 'connected',
+                'message': f'Replaying {os.path.basename(self.capture_path)}'
+            })
+            
+            return True
+            
+        except Exception as e:
+            self.status = ConnectionStatus.ERROR
+            logger.error(f"Replay error for session {self.config.session_id}: {str(e)}")
+            self.stats['errors'].append({
+                'timestamp': time.time(),
+                'error': str(e),
+                'type': 'replay'
+            })
+            
+            socketio.emit('session_status', {
+                'session_id': self.config.session_id,
+                'status': 'error',
+                'message': str(e)
+            })
+            
+            return False
+    
+    def send_message(self, message: str) -> bool:
+        """Replayed sessions have no device behind them"""
+        if self.status != ConnectionStatus.CONNECTED:
+            return False
+        return self._mock_send(message)
+    
+    def _replay_loop(self, records: Iterator[Tuple[int, bytes]]):
+        """Feed recorded chunks into the session, preserving their timing"""
+        replay = self.stats['replay']
+        start_ns = time.perf_counter_ns()
+        replay['started'] = time.time()
+        offset_ns = 0
+        
+        try:
+            for delta_ns, data in records:
+                if not self.running:
+                    break
+                
+                if self.speed > 0:
+                    # Schedule against the replay start so sleep overshoot does not accumulate
+                    offset_ns += delta_ns
+                    target_ns = start_ns + int(offset_ns / self.speed)
+                    while self.running:
+                        remaining = (target_ns - time.perf_counter_ns()) / 1e9
+                        if remaining <= 0:
+                            break
+                        self._flush_stale_line()
+                        time.sleep(min(remaining, 0.1))
+                    
+                    if not self.running:
+                        break
+                
+                # A recorded gap longer than the read timeout ended a partial line when
+                # it was captured live; honour it at any replay speed
+                if delta_ns >= self.config.timeout * 1e9:
+                    self._flush_line_buffer()
+                
+                self._ingest_data(data, capture_timestamp())
+                replay['chunks_replayed'] += 1
+                replay['bytes_replayed'] += len(data)
+                
+        except Exception as e:
+            logger.error(f"Replay read error for session {self.config.session_id}: {str(e)}")
+            self.stats['errors'].append({
+                'timestamp': time.time(),
+                'error': str(e),
+                'type': 'replay'
+            })
+        finally:
+            records.close()
+        
+        if self.running:
+            self._flush_line_buffer()
+        
+        duration = (time.perf_counter_ns() - start_ns) / 1e9
+        replay['finished'] = time.time()
+        replay['duration'] = duration
+        if duration > 0:
+            replay['throughput_bps'] = replay['bytes_replayed'] / duration
+        
+        logger.info(f"Replay finished for session {self.config.session_id}: "
+                    f"{replay['chunks_replayed']} chunks, {replay['bytes_replayed']} bytes in {duration:.3f}s")
+        
+        if self.running:
+            socketio.emit('session_status', {
+                'session_id': self.config.session_id,
+                'status': 'connected',
+                'message': 'Replay finished'
+            })
+
+
+class BridgePortView:
+    """Read-only view of a session's port handed to RFC 2217 clients
+    
+    The port is shared by the session and every bridge client, so no client
+    may retune it for the others: setting changes are ignored, PortManager
+    answers with the current settings, and purge requests do nothing.
+    """
+    
+    def __init__(self, port):
+        self._port = port
+    
+    def _read_only(name):
+        return property(lambda self: getattr(self._port, name), lambda self, value: None)
+    
+    baudrate = _read_only('baudrate')
+    bytesize = _read_only('bytesize')
+    parity = _read_only('parity')
+    stopbits = _read_only('stopbits')
+    xonxoff = _read_only('xonxoff')
+    rtscts = _read_only('rtscts')
+    dtr = _read_only('dtr')
+    rts = _read_only('rts')
+    break_condition = _read_only('break_condition')
+    cts = _read_only('cts')
+    dsr = _read_only('dsr')
+    ri = _read_only('ri')
+    cd = _read_only('cd')
+    
+    del _read_only
+    
+    def reset_input_buffer(self):
+        pass
+    
+    def reset_output_buffer(self):
+        pass
+
+
+if SERIAL_AVAILABLE:
+    class BridgePortManager(serial.rfc2217.PortManager):
+        """RFC 2217 handler that reports control line changes as refused"""
+        
+        _CONTROL_STATE = {
+            serial.rfc2217.SET_CONTROL_BREAK_ON: ('break_condition', serial.rfc2217.SET_CONTROL_BREAK_ON,
+                                                  serial.rfc2217.SET_CONTROL_BREAK_OFF),
+            serial.rfc2217.SET_CONTROL_BREAK_OFF: ('break_condition', serial.rfc2217.SET_CONTROL_BREAK_ON,
+                                                   serial.rfc2217.SET_CONTROL_BREAK_OFF),
+            serial.rfc2217.SET_CONTROL_DTR_ON: ('dtr', serial.rfc2217.SET_CONTROL_DTR_ON,
+                                                serial.rfc2217.SET_CONTROL_DTR_OFF),
+            serial.rfc2217.SET_CONTROL_DTR_OFF: ('dtr', serial.rfc2217.SET_CONTROL_DTR_ON,
+                                                 serial.rfc2217.SET_CONTROL_DTR_OFF),
+            serial.rfc2217.SET_CONTROL_RTS_ON: ('rts', serial.rfc2217.SET_CONTROL_RTS_ON,
+                                                serial.rfc2217.SET_CONTROL_RTS_OFF),
+            serial.rfc2217.SET_CONTROL_RTS_OFF: ('rts', serial.rfc2217.SET_CONTROL_RTS_ON,
+                                                 serial.rfc2217.SET_CONTROL_RTS_OFF),
+        }
+        
+        _FLOW_CONTROL_CHANGES = (
+            serial.rfc2217.SET_CONTROL_USE_NO_FLOW_CONTROL,
+            serial.rfc2217.SET_CONTROL_USE_SW_FLOW_CONTROL,
+            serial.rfc2217.SET_CONTROL_USE_HW_FLOW_CONTROL,
+        )
+        
+        def _telnet_process_subnegotiation(self, suboption):
+            # PortManager echoes the requested control state back; answer with
+            # the actual state instead, since BridgePortView ignores the change
+            if suboption[0:1] == serial.rfc2217.COM_PORT_OPTION and suboption[1:2] == serial.rfc2217.SET_CONTROL:
+                control = suboption[2:3]
+                if control in self._FLOW_CONTROL_CHANGES:
+                    suboption = suboption[:2] + serial.rfc2217.SET_CONTROL_REQ_FLOW_SETTING
+                elif control in self._CONTROL_STATE:
+                    name, on, off = self._CONTROL_STATE[control]
+                    self.rfc2217_send_subnegotiation(serial.rfc2217.SERVER_SET_CONTROL,
+                                                     on if getattr(self.serial, name) else off)
+                    return
+            super()._telnet_process_subnegotiation(suboption)
+
+
+class BridgeClient:
+    """One TCP reader/writer attached to a session bridge"""
+    
+    MODEM_CHECK_INTERVAL = 0.5  # seconds between RFC 2217 modem state polls
+    
+    def __init__(self, bridge: 'SerialBridge', sock: socket.socket, address: Tuple[str, int]):
+        self.bridge = bridge
+        self.sock = sock
+        self.address = f"{address[0]}:{address[1]}"
+        self.active = True
+        self.condition = threading.Condition()
+        self.queue: deque = deque()
+        self.queued_bytes = 0
+        self.bytes_sent = 0
+        self.bytes_dropped = 0
+        self.bytes_written = 0
+        self.port_manager = None
+        
+        if bridge.mode == 'rfc2217':
+            # Negotiation replies are queued through write() like any other data
+            self.port_manager = BridgePortManager(BridgePortView(bridge.session.connection), self)
+    
+    def start(self):
+        threading.Thread(target=self._send_loop, daemon=True).start()
+        threading.Thread(target=self._receive_loop, daemon=True).start()
+    
+    def write(self, data: bytes):
+        """Queue bytes for this client; drops the oldest data when over the limit"""
+        with self.condition:
+            if not self.active:
+                return
+            self.queue.append(data)
+            self.queued_bytes += len(data)
+            
+            # Never block the producer: a stalled client loses its oldest data instead
+            while self.queued_bytes > self.bridge.max_queue_bytes and len(self.queue) > 1:
+                dropped = self.queue.popleft()
+                self.queued_bytes -= len(dropped)
+                self.bytes_dropped += len(dropped)
+            
+            self.condition.notify()
+    
+    def close(self):
+        with self.condition:
+            if not self.active:
+                return
+            self.active = False
+            self.queue.clear()
+            self.queued_bytes = 0
+            self.condition.notify()
+        
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.sock.close()
+        self.bridge._remove_client(self)
+    
+    def _send_loop(self):
+        """Drain the queue to the socket"""
+        last_modem_check_ns = 0
+        try:
+            while self.active:
+                with self.condition:
+                    if not self.queue:
+                        self.condition.wait(timeout=self.MODEM_CHECK_INTERVAL)
+                    chunks = list(self.queue)
+                    self.queue.clear()
+                    self.queued_bytes = 0
+                
+                for chunk in chunks:
+                    self.sock.sendall(chunk)
+                    self.bytes_sent += len(chunk)
+                
+                # Poll modem lines on a fixed interval so updates also flow under steady traffic
+                if self.port_manager is not None:
+                    now_ns = time.perf_counter_ns()
+                    if now_ns - last_modem_check_ns >= self.MODEM_CHECK_INTERVAL * 1e9:
+                        last_modem_check_ns = now_ns
+                        self.port_manager.check_modem_lines()
+        except Exception as e:
+            if self.active:
+                logger.info(f"Bridge client {self.address} send ended: {str(e)}")
+        finally:
+            self.close()
+    
+    def _receive_loop(self):
+        """Forward bytes written by the client into the session"""
+        session = self.bridge.session
+        try:
+            while self.active:
+                data = self.sock.recv(4096)
+                if not data:
+                    break
+                if self.port_manager is not None:
+                    data = b''.join(self.port_manager.filter(data))
+                if data:
+                    self.bytes_written += session.write_raw(data)
+        except Exception as e:
+            if self.active:
+                logger.info(f"Bridge client {self.address} receive ended: {str(e)}")
+        finally:
+            self.close()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'address': self.address,
+            'queued_bytes': self.queued_bytes,
+            'bytes_sent': self.bytes_sent,
+            'bytes_dropped': self.bytes_dropped,
+            'bytes_written': self.bytes_written
+        }
+
+
+class SerialBridge:
+    """TCP listener (raw or RFC 2217) that fans a session's bytes out to many clients"""
+    
+    MODES = ('raw', 'rfc2217')
+    
+    def __init__(self, session: SerialSession, host: str, port: int, mode: str = 'raw',
+                 max_queue_bytes: int = 1024 * 1024):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown bridge mode: {mode}")
+        if mode == 'rfc2217' and not (SERIAL_AVAILABLE and session.connection):
+            raise ValueError("RFC 2217 mode requires a real serial port")
+        
+        self.session = session
+        self.host = host
+        self.port = port
+        self.mode = mode
+        self.max_queue_bytes = max_queue_bytes
+        self.running = False
+        self.server: Optional[socket.socket] = None
+        self.lock = threading.Lock()
+        self.clients: Tuple[BridgeClient, ...] = ()  # Replaced, never mutated, so publish() needs no lock
+        self.bytes_published = 0
+        self.clients_served = 0
+    
+    def start(self):
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            server.bind((self.host, self.port))
+            server.listen()
+            server.settimeout(0.5)
+        except Exception:
+            server.close()
+            raise
+        
+        self.server = server
+        self.port = server.getsockname()[1]
+        self.running = True
+        threading.Thread(target=self._accept_loop, daemon=True).start()
+        logger.info(f"Session {self.session.config.session_id} bridged on "
+                    f"{self.host}:{self.port} ({self.mode})")
+    
+    def stop(self):
+        # Under the lock so the accept loop cannot attach a client after this point
+        with self.lock:
+            self.running = False
+            clients = self.clients
+        
+        if self.server:
+            self.server.close()
+        
+        for client in clients:
+            client.close()
+        logger.info(f"Bridge for session {self.session.config.session_id} stopped")
+    
+    def publish(self, data: bytes):
+        """Hand received bytes to every client without copying them"""
+        clients = self.clients
+        if not clients:
+            return
+        
+        self.bytes_published += len(data)
+        escaped = None
+        for client in clients:
+            if client.port_manager is None:
+                client.write(data)
+            else:
+                # Telnet IAC escaping is computed once and shared by all RFC 2217 clients
+                if escaped is None:
+                    escaped = data.replace(b'\xff', b'\xff\xff')
+                client.write(escaped)
+    
+    def _accept_loop(self):
+        while self.running:
+            try:
+                sock, address = self.server.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                break
+            
+            try:
+                sock.settimeout(None)
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                client = BridgeClient(self, sock, address)
+            except Exception as e:
+                logger.error(f"Bridge client setup error: {str(e)}")
+                sock.close()
+                continue
+            
+            with self.lock:
+                if not self.running:
+                    sock.close()
+                    break
+                self.clients = self.clients + (client,)
+                self.clients_served += 1
+                client.start()
+            logger.info(f"Bridge client {client.address} attached to session {self.session.config.session_id}")
+    
+    def _remove_client(self, client: BridgeClient):
+        with self.lock:
+            if client in self.clients:
+                self.clients = tuple(c for c in self.clients if c is not client)
+                logger.info(f"Bridge client {client.address} detached from session {self.session.config.session_id}")
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'host': self.host,
+            'port': self.port,
+            'mode': self.mode,
+            'max_queue_bytes': self.max_queue_bytes,
+            'bytes_published': self.bytes_published,
+            'clients_served': self.clients_served,
+            'clients': [client.get_stats() for client in self.clients]
+        }
+
+
 class UARTManager:
     """Main manager for multiple UART sessions"""
     
@@ -502,6 +1249,78 @@ class UARTManager:
             logger.error(f"Disconnect session error: {str(e)}")
             return False
     
+    def start_recording(self, session_id: int, filename: Optional[str] = None) -> Optional[str]:
+        """Start recording a session, returning the capture file path
+        
+        Raises FileExistsError if the capture file already exists.
+        """
+        if session_id not in self.sessions:
+            logger.error(f"Session {session_id} not found")
+            return None
+        
+        path = self._capture_path(filename or f"session{session_id}_{time.strftime('%Y%m%d_%H%M%S')}.uartcap")
+        if self.sessions[session_id].start_recording(path):
+            return path
+        return None
+    
+    def stop_recording(self, session_id: int) -> Optional[Dict[str, Any]]:
+        """Stop recording a session"""
+        if session_id not in self.sessions:
+            return None
+        
+        return self.sessions[session_id].stop_recording()
+    
+    def replay_session(self, session_id: int, filename: str, speed: float = 1.0) -> bool:
+        """Create a virtual session that replays a capture file"""
+        try:
+            if session_id in self.sessions:
+                self.disconnect_session(session_id)
+            
+            path = self._capture_path(filename)
+            config = SessionConfig(
+                session_id=session_id,
+                port=f"replay:{os.path.basename(path)}"
+            )
+            
+            session = ReplaySession(config, path, speed)
+            success = session.connect()
+            
+            if success:
+                self.sessions[session_id] = session
+                self.global_stats['total_sessions_created'] += 1
+                self.global_stats['last_activity'] = time.time()
+                logger.info(f"Session {session_id} replaying {path} at speed {speed or 'max'}")
+            
+            return success
+            
+        except Exception as e:
+            logger.error(f"Replay session error: {str(e)}")
+            return False
+    
+    def start_bridge(self, session_id: int, port: int, host: str = '127.0.0.1', mode: str = 'raw',
+                     max_queue_bytes: int = 1024 * 1024) -> Optional[Dict[str, Any]]:
+        """Open a TCP bridge for a session, returning the bridge statistics"""
+        if session_id not in self.sessions:
+            logger.error(f"Session {session_id} not found")
+            return None
+        
+        session = self.sessions[session_id]
+        if session.start_bridge(port, host, mode, max_queue_bytes):
+            return session.bridge.get_stats()
+        return None
+    
+    def stop_bridge(self, session_id: int) -> Optional[Dict[str, Any]]:
+        """Close the TCP bridge of a session"""
+        if session_id not in self.sessions:
+            return None
+        
+        return self.sessions[session_id].stop_bridge()
+    
+    def _capture_path(self, filename: str) -> str:
+        """Resolve a capture filename inside the capture directory"""
+        # Only the base name is honoured so API callers cannot escape CAPTURE_DIR
+        return os.path.join(CAPTURE_DIR, os.path.basename(filename))
+    
     def send_message(self, session_id: int, message: str) -> bool:
         """Send message to specific session"""
         try:
@@ -571,6 +1390,42 @@ class UARTManager:
             'messages': session.get_recent_messages(message_count)
         }
     
+    def iter_merged_timeline(self, session_ids: Optional[Iterable[int]] = None,
+                             newest_first: bool = False) -> Iterator[SerialMessage]:
+        """Stream messages from several sessions as one time-ordered sequence
+        
+        Each session buffer is already ordered by capture time, so the
+        sessions are combined with a lazy k-way merge instead of a sort.
+        """
+        if session_ids is None:
+            session_ids = list(self.sessions.keys())
+        
+        buffers = []
+        for session_id in session_ids:
+            session = self.sessions.get(session_id)
+            if session is None:
+                continue
+            messages = session.snapshot_messages()
+            buffers.append(reversed(messages) if newest_first else messages)
+        
+        return heapq.merge(*buffers, key=lambda msg: msg.monotonic_ns, reverse=newest_first)
+    
+    def get_merged_timeline(self, session_ids: Optional[Iterable[int]] = None,
+                            count: int = 100, since: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Get the most recent messages across sessions in time order"""
+        timeline = []
+        
+        # Walk backwards from the newest message so only `count` items are merged
+        for msg in self.iter_merged_timeline(session_ids, newest_first=True):
+            if since is not None and msg.timestamp <= since:
+                break
+            timeline.append(asdict(msg))
+            if count > 0 and len(timeline) >= count:
+                break
+        
+        timeline.reverse()
+        return timeline
+    
     def export_all_data(self, message_count: int = 100) -> Dict[str, Any]:
         """Export all data from manager"""
         export_data = {
@@ -652,6 +1507,94 @@ def send_message(session_id):
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+@app.route('/api/sessions/<int:session_id>/record/start', methods=['POST'])
+def start_recording(session_id):
+    """Start recording raw received bytes of a session"""
+    try:
+        data = request.get_json(silent=True) or {}
+        path = uart_manager.start_recording(session_id, data.get('filename'))
+        if path is None:
+            return jsonify({'success': False, 'error': 'Could not start recording'}), 400
+        
+        return jsonify({'success': True, 'path': path})
+    except FileExistsError:
+        return jsonify({'success': False, 'error': 'Capture file already exists'}), 409
+    except Exception as e:
+        logger.error(f"Start recording error: {str(e)}")
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
+@app.route('/api/sessions/<int:session_id>/record/stop', methods=['POST'])
+def stop_recording(session_id):
+    """Stop recording a session"""
+    try:
+        stats = uart_manager.stop_recording(session_id)
+        return jsonify({'success': stats is not None, 'recording': stats})
+    except Exception as e:
+        logger.error(f"Stop recording error: {str(e)}")
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
+@app.route('/api/sessions/<int:session_id>/replay', methods=['POST'])
+def replay_session(session_id):
+    """Replay a capture file into a virtual session"""
+    try:
+        data = request.get_json()
+        filename = data.get('filename')
+        
+        if not filename:
+            return jsonify({'success': False, 'error': 'Filename is required'}), 400
+        
+        try:
+            speed = float(data.get('speed', 1.0))
+        except (TypeError, ValueError):
+            speed = -1.0
+        if not math.isfinite(speed) or speed < 0:
+            return jsonify({'success': False, 'error': 'Speed must be 0 (maximum) or a positive number'}), 400
+        
+        success = uart_manager.replay_session(session_id, filename, speed)
+        return jsonify({'success': success})
+    except Exception as e:
+        logger.error(f"Replay session error: {str(e)}")
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
+@app.route('/api/sessions/<int:session_id>/bridge/start', methods=['POST'])
+def start_bridge(session_id):
+    """Expose a session on a TCP port (raw or RFC 2217)"""
+    try:
+        data = request.get_json()
+        port = data.get('port')
+        host = data.get('host', '127.0.0.1')
+        mode = data.get('mode', 'raw')
+        max_queue_bytes = int(data.get('max_queue_bytes', 1024 * 1024))
+        
+        if port is None:
+            return jsonify({'success': False, 'error': 'Port is required'}), 400
+        if mode not in SerialBridge.MODES:
+            return jsonify({'success': False, 'error': f'Mode must be one of {", ".join(SerialBridge.MODES)}'}), 400
+        
+        bridge = uart_manager.start_bridge(session_id, int(port), host, mode, max_queue_bytes)
+        if bridge is None:
+            return jsonify({'success': False, 'error': 'Could not start bridge'}), 400
+        
+        return jsonify({'success': True, 'bridge': bridge})
+    except Exception as e:
+        logger.error(f"Start bridge error: {str(e)}")
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
+@app.route('/api/sessions/<int:session_id>/bridge/stop', methods=['POST'])
+def stop_bridge(session_id):
+    """Close the TCP bridge of a session"""
+    try:
+        stats = uart_manager.stop_bridge(session_id)
+        return jsonify({'success': stats is not None, 'bridge': stats})
+    except Exception as e:
+        logger.error(f"Stop bridge error: {str(e)}")
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
 @app.route('/api/sessions/<int:session_id>/stats', methods=['GET'])
 def get_session_stats(session_id):
     """Get session statistics"""
@@ -697,6 +1640,28 @@ def export_data():
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+@app.route('/api/timeline', methods=['GET'])
+def get_timeline():
+    """Get merged, time-ordered messages across sessions"""
+    try:
+        sessions_arg = request.args.get('sessions')
+        count = request.args.get('count', 100, type=int)
+        since = request.args.get('since', type=float)
+        
+        session_ids = None
+        if sessions_arg:
+            try:
+                session_ids = [int(s) for s in sessions_arg.split(',') if s.strip()]
+            except ValueError:
+                return jsonify({'success': False, 'error': 'Invalid sessions list'}), 400
+        
+        timeline = uart_manager.get_merged_timeline(session_ids, count, since)
+        return jsonify({'success': True, 'messages': timeline})
+    except Exception as e:
+        logger.error(f"Get timeline error: {str(e)}")
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
 # Socket.IO event handlers
 @socketio.on('connect')
 def handle_connect():